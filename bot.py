@@ -8,18 +8,29 @@ Automates task tracking, PR notifications, AI code summaries, approvals, and mer
 import os
 import hmac
 import hashlib
-import json
 import logging
 import re
-from typing import Optional, Dict, Any
+import secrets
+import threading
+import time
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Optional, Dict, Any, List, Tuple
 from urllib.parse import parse_qs
 
+import redis
 from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from dotenv import load_dotenv
+from cachetools import TTLCache
 from notion_client import Client as NotionClient
 from slack_sdk import WebClient as SlackClient
+import jwt
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
 from langchain_openai import ChatOpenAI
-from github import Github, GithubIntegration
 
 # Configure logging
 logging.basicConfig(
@@ -30,7 +41,21 @@ logger = logging.getLogger(__name__)
 
 load_dotenv()
 
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, used by jsonify and request.get_json."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """Deserialize a JSON string or bytes."""
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 
 class Config:
@@ -51,11 +76,16 @@ class Config:
         self.slack_token = os.getenv("SLACK_USER_TOKEN")
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
         self.webhook_secret = os.getenv("WEBHOOK_SECRET")
+        self.webhook_secret_bytes = (self.webhook_secret or "").encode()
         self.github_repository = os.getenv("GITHUB_REPOSITORY")
         self.github_token = os.getenv("GITHUB_TOKEN")
         self.github_app_id = os.getenv("GITHUB_APP_ID")
         self.github_app_private_key = os.getenv("GITHUB_APP_PRIVATE_KEY")
         self.default_slack_channel = os.getenv("SLACK_CHANNEL", "#pr-reviews")
+        self.slack_batch_window = float(os.getenv("SLACK_BATCH_WINDOW", "15"))
+        self.background_workers = int(os.getenv("BACKGROUND_WORKERS", "8"))
+        self.redis_url = os.getenv("REDIS_URL")
+        self.ai_review_patches = os.getenv("AI_REVIEW_PATCHES", "false").lower() == "true"
 
     def validate(self):
         """Validate required environment variables."""
@@ -70,6 +100,198 @@ class Config:
         logger.info("Configuration validated successfully")
 
 
+def pooled_session() -> requests.Session:
+    """Create a requests session that reuses keep-alive connections across threads."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class locked_cached_property(cached_property):
+    """cached_property that builds its value at most once, even when first read from several threads."""
+
+    def __init__(self, func):
+        super().__init__(func)
+        # cached_property lost its own lock in Python 3.12
+        self._init_lock = threading.Lock()
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return instance.__dict__[self.attrname]
+        except KeyError:
+            pass
+        with self._init_lock:
+            if self.attrname not in instance.__dict__:
+                instance.__dict__[self.attrname] = self.func(instance)
+            return instance.__dict__[self.attrname]
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket that also backs off when GitHub reports a low quota.
+
+    GitHub meters REST ("core") and GraphQL requests separately, so each
+    quota gets its own limiter.
+    """
+
+    def __init__(self, rate: int, per: float, reserve: int = 100, max_pause: float = 60):
+        self.capacity = rate
+        self.fill_rate = rate / per
+        self.reserve = reserve
+        # Quota resets can be up to an hour away; fail instead of parking a pool thread that long
+        self.max_pause = max_pause
+        self.tokens = float(rate)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Block until a request may be sent.
+
+        Raises:
+            RuntimeError: If the quota stays exhausted for longer than max_pause
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+                self.updated = now
+
+                wait = self.paused_until - time.time()
+                if wait > self.max_pause:
+                    raise RuntimeError(f"GitHub quota exhausted, resets in {int(wait)}s")
+                if wait > 0:
+                    logger.warning(f"GitHub quota low, waiting {wait:.0f}s for reset")
+                else:
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.fill_rate
+
+            time.sleep(wait)
+
+    def observe(self, remaining: int, reset: Optional[str]) -> None:
+        """
+        Sync the bucket with the quota GitHub reported for this resource.
+
+        Args:
+            remaining: X-RateLimit-Remaining of the response
+            reset: X-RateLimit-Reset of the response (epoch seconds)
+        """
+        with self._lock:
+            self.tokens = min(self.tokens, max(remaining - self.reserve, 0))
+            # Keep a safety buffer for retries and manual use of the same token
+            if remaining <= self.reserve and reset:
+                self.paused_until = float(reset)
+                logger.warning(f"GitHub quota low ({remaining} left), pausing until reset at {reset}")
+
+
+class TTLStore:
+    """Expiring key/value store, shared through Redis when configured, in-process otherwise."""
+
+    def __init__(self, redis_client: Optional[redis.Redis], prefix: str, ttl: int, maxsize: int = 1024):
+        self.redis = redis_client
+        self.prefix = prefix
+        self.ttl = ttl
+        self._local = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a value.
+
+        Args:
+            key: Key without the store prefix
+
+        Returns:
+            Stored value, or None if missing, expired, or Redis is unreachable
+        """
+        if self.redis is not None:
+            try:
+                return self.redis.get(self.prefix + key)
+            except redis.RedisError as e:
+                logger.error(f"Redis error reading {self.prefix}{key}: {e}")
+                return None
+
+        with self._lock:
+            return self._local.get(key)
+
+    @property
+    def shared(self) -> bool:
+        """Whether values are visible to other processes and survive restarts."""
+        return self.redis is not None
+
+    def set(self, key: str, value: str) -> bool:
+        """
+        Store a value for the store's TTL.
+
+        Args:
+            key: Key without the store prefix
+            value: Value to store
+
+        Returns:
+            True if stored, False if Redis is unreachable
+        """
+        if self.redis is not None:
+            try:
+                self.redis.setex(self.prefix + key, self.ttl, value)
+                return True
+            except redis.RedisError as e:
+                logger.error(f"Redis error writing {self.prefix}{key}: {e}")
+                return False
+
+        with self._lock:
+            self._local[key] = value
+        return True
+
+    def add(self, key: str, value: str) -> bool:
+        """
+        Store a value only if the key is not already present (SETNX).
+
+        Args:
+            key: Key without the store prefix
+            value: Value to store
+
+        Returns:
+            True if the value was stored, False if the key already existed.
+            Redis errors count as stored, so an outage never drops work.
+        """
+        if self.redis is not None:
+            try:
+                return bool(self.redis.set(self.prefix + key, value, nx=True, ex=self.ttl))
+            except redis.RedisError as e:
+                logger.error(f"Redis error writing {self.prefix}{key}: {e}")
+                return True
+
+        with self._lock:
+            if key in self._local:
+                return False
+            self._local[key] = value
+            return True
+
+    def discard(self, key: str) -> None:
+        """
+        Remove a value if present.
+
+        Args:
+            key: Key without the store prefix
+        """
+        if self.redis is not None:
+            try:
+                self.redis.delete(self.prefix + key)
+            except redis.RedisError as e:
+                logger.error(f"Redis error deleting {self.prefix}{key}: {e}")
+            return
+
+        with self._lock:
+            self._local.pop(key, None)
+
+
 class NotionService:
     """Handle all Notion operations."""
 
@@ -77,6 +299,12 @@ class NotionService:
         self.client = NotionClient(auth=config.notion_token)
         self.database_id = config.notion_database_id
 
+        # Task ID -> page ID lookups recur across PR events. Misses expire
+        # quickly so a task created after the PR was opened is still found.
+        self._task_cache = TTLCache(maxsize=1024, ttl=3600)
+        self._missing_tasks = TTLCache(maxsize=1024, ttl=60)
+        self._cache_lock = threading.Lock()
+
     def find_task_by_id(self, task_id: str) -> Optional[str]:
         """
         Find Notion page ID by Task ID property.
@@ -87,6 +315,13 @@ class NotionService:
         Returns:
             Notion page ID if found, None otherwise
         """
+        with self._cache_lock:
+            if task_id in self._task_cache:
+                return self._task_cache[task_id]
+            if task_id in self._missing_tasks:
+                logger.info(f"Task {task_id} recently not found in Notion, skipping lookup")
+                return None
+
         try:
             response = self.client.databases.query(
                 database_id=self.database_id,
@@ -101,15 +336,30 @@ class NotionService:
             if response['results']:
                 page_id = response['results'][0]['id']
                 logger.info(f"Found Notion page {page_id} for task {task_id}")
+                with self._cache_lock:
+                    self._task_cache[task_id] = page_id
                 return page_id
             else:
                 logger.warning(f"No Notion page found for task {task_id}")
+                with self._cache_lock:
+                    self._missing_tasks[task_id] = True
                 return None
 
         except Exception as e:
             logger.error(f"Error finding Notion task {task_id}: {e}")
             return None
 
+    def invalidate_task(self, task_id: str) -> None:
+        """
+        Drop a cached task lookup.
+
+        Args:
+            task_id: The task identifier (e.g., 'TASK-042')
+        """
+        with self._cache_lock:
+            self._task_cache.pop(task_id, None)
+            self._missing_tasks.pop(task_id, None)
+
     def update_task(self, page_id: str, status: str, pr_link: Optional[str] = None) -> bool:
         """
         Update Notion task with new status and optional PR link.
@@ -164,67 +414,273 @@ class NotionService:
 class GitHubService:
     """Handle all GitHub operations."""
 
+    API_URL = "https://api.github.com"
+    GRAPHQL_URL = f"{API_URL}/graphql"
+
+    # PR metadata and its changed files in a single round-trip
+    PR_DETAILS_QUERY = """
+    query($owner: String!, $name: String!, $number: Int!) {
+      repository(owner: $owner, name: $name) {
+        pullRequest(number: $number) {
+          number
+          title
+          body
+          url
+          additions
+          deletions
+          changedFiles
+          author { login }
+          files(first: 100) {
+            nodes { path additions deletions changeType }
+          }
+        }
+      }
+    }
+    """
+
+    # GraphQL PatchStatus values that differ from the REST file status
+    FILE_STATUSES = {"DELETED": "removed"}
+
+    # Patches can be hundreds of lines each; keep only the head of each one
+    MAX_PATCH_CHARS = 2048
+
+    # Re-mint App installation tokens this many seconds before they expire
+    TOKEN_REFRESH_MARGIN = 300
+
+    # Stay under the 5,000/hour REST quota even when bursts of webhooks arrive
+    REQUESTS_PER_HOUR = 4500
+
     def __init__(self, config: Config):
         self.config = config
+        self.owner, self.repo_name = config.github_repository.split("/", 1)
+
+        # Writes go straight to the REST endpoints, without fetching the PR first
+        self.session = pooled_session()
+        self.session.headers.update({"Accept": "application/vnd.github+json"})
+        # Keyed by X-RateLimit-Resource; REST and GraphQL have independent quotas
+        self.limiters = {
+            "core": RateLimiter(self.REQUESTS_PER_HOUR, 3600),
+            "graphql": RateLimiter(self.REQUESTS_PER_HOUR, 3600),
+        }
+
+        # GitHub App installation tokens expire after an hour; minted on first use
+        self._installation_id: Optional[int] = None
+        self._token: Optional[str] = None
+        self._token_expires_at = 0.0
+        self._token_lock = threading.Lock()
 
-        # Initialize GitHub client with appropriate authentication
         if config.github_token:
-            self.client = Github(config.github_token)
             logger.info("GitHub initialized with personal access token")
-        elif config.github_app_id and config.github_app_private_key:
-            # Use GitHub App authentication
-            integration = GithubIntegration(
-                config.github_app_id,
-                config.github_app_private_key
-            )
-            # Get installation token for the repository
-            installation = integration.get_installations()[0]
-            token = integration.get_access_token(installation.id).token
-            self.client = Github(token)
+        else:
             logger.info("GitHub initialized with App authentication")
 
-        self.repo = self.client.get_repo(config.github_repository)
+    @property
+    def token(self) -> str:
+        """API token; GitHub App installation tokens are re-minted shortly before expiry."""
+        if self.config.github_token:
+            return self.config.github_token
+
+        if time.time() > self._token_expires_at - self.TOKEN_REFRESH_MARGIN:
+            self._refresh_token()
+        return self._token
+
+    def _refresh_token(self) -> None:
+        """Mint a new GitHub App installation token."""
+        with self._token_lock:
+            # Another thread may have refreshed while we waited for the lock
+            if time.time() <= self._token_expires_at - self.TOKEN_REFRESH_MARGIN:
+                return
+
+            app_headers = {"Authorization": f"Bearer {self._app_jwt()}"}
+
+            if self._installation_id is None:
+                # Get the App's installation for the repository
+                response = self.session.get(
+                    f"{self.API_URL}/repos/{self.config.github_repository}/installation",
+                    headers=app_headers,
+                    timeout=30
+                )
+                response.raise_for_status()
+                self._installation_id = response.json()['id']
+
+            response = self.session.post(
+                f"{self.API_URL}/app/installations/{self._installation_id}/access_tokens",
+                headers=app_headers,
+                timeout=30
+            )
+            response.raise_for_status()
+            access_token = response.json()
+
+            self._token = access_token['token']
+            # fromisoformat() only accepts a trailing "Z" from Python 3.11
+            expires_at = datetime.fromisoformat(access_token['expires_at'].replace('Z', '+00:00'))
+            self._token_expires_at = expires_at.timestamp()
+            logger.info(f"Minted GitHub App installation token, expires {access_token['expires_at']}")
+
+    def _app_jwt(self) -> str:
+        """Create a short-lived JWT authenticating as the GitHub App."""
+        now = int(time.time())
+        payload = {
+            # Backdated to tolerate clock drift; GitHub allows at most 10 minutes
+            "iat": now - 60,
+            "exp": now + 540,
+            "iss": str(self.config.github_app_id)
+        }
+        return jwt.encode(payload, self.config.github_app_private_key, algorithm="RS256")
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send one request through the rate limiter for its quota."""
+        self.limiters["graphql" if url == self.GRAPHQL_URL else "core"].acquire()
+        response = self.session.request(
+            method,
+            url,
+            headers={"Authorization": f"token {self.token}"},
+            timeout=30,
+            **kwargs
+        )
+        self._observe_quota(response.headers)
+        return response
+
+    def _observe_quota(self, headers) -> None:
+        """Feed the X-RateLimit-* headers of a response to the limiter of the quota they describe."""
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is None:
+            return
+
+        limiter = self.limiters.get(headers.get('X-RateLimit-Resource', 'core'))
+        if limiter is not None:
+            limiter.observe(int(remaining), headers.get('X-RateLimit-Reset'))
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a rate-limited request to the GitHub API.
+
+        Args:
+            method: HTTP method
+            url: Full API URL
+            **kwargs: Passed through to requests
+
+        Returns:
+            The response, after one retry if GitHub asked us to back off
+
+        Raises:
+            RuntimeError: If GitHub asks us to back off for longer than the limiter's max_pause
+        """
+        response = self._send(method, url, **kwargs)
+
+        # Secondary rate limits answer 403/429 with Retry-After; wait it out once
+        retry_after = response.headers.get('Retry-After')
+        if response.status_code in (403, 429) and retry_after:
+            wait = int(retry_after)
+            max_pause = self.limiters["graphql" if url == self.GRAPHQL_URL else "core"].max_pause
+            if wait > max_pause:
+                raise RuntimeError(f"GitHub rate limited {method} {url} for {wait}s")
+            logger.warning(f"GitHub rate limited {method} {url}, retrying in {wait}s")
+            time.sleep(wait)
+            response = self._send(method, url, **kwargs)
+
+        return response
+
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run a GitHub GraphQL query.
+
+        Args:
+            query: GraphQL query document
+            variables: Query variables
+
+        Returns:
+            The response's "data" object
+        """
+        response = self._request(
+            "POST",
+            self.GRAPHQL_URL,
+            json={"query": query, "variables": variables}
+        )
+        response.raise_for_status()
+        result = response.json()
+
+        # GraphQL reports query errors with a 200 status
+        if result.get('errors'):
+            raise RuntimeError(f"GitHub GraphQL error: {result['errors'][0].get('message')}")
 
-    def get_pr_details(self, pr_number: int) -> Dict[str, Any]:
+        return result['data']
+
+    def get_patches(self, pr_number: int) -> Dict[str, str]:
+        """
+        Get truncated diff patches for a PR's first 100 files.
+
+        Args:
+            pr_number: Pull request number
+
+        Returns:
+            Mapping of filename to patch text
+        """
+        response = self._request(
+            "GET",
+            f"{self.API_URL}/repos/{self.config.github_repository}/pulls/{pr_number}/files",
+            params={"per_page": 100}
+        )
+        response.raise_for_status()
+
+        return {
+            file['filename']: (file.get('patch') or '')[:self.MAX_PATCH_CHARS]
+            for file in response.json()
+        }
+
+    def get_pr_details(self, pr_number: int, include_patches: bool = False) -> Dict[str, Any]:
         """
         Get PR details including files and metadata.
 
         Args:
             pr_number: Pull request number
+            include_patches: Also fetch truncated diff patches (one extra request)
 
         Returns:
             Dictionary with PR details
         """
         try:
-            pr = self.repo.get_pull(pr_number)
-            files = pr.get_files()
-
-            file_changes = []
-            total_additions = 0
-            total_deletions = 0
-
-            for file in files:
-                file_changes.append({
-                    'filename': file.filename,
-                    'additions': file.additions,
-                    'deletions': file.deletions,
-                    'changes': file.changes,
-                    'status': file.status,
-                    'patch': file.patch if hasattr(file, 'patch') else None
-                })
-                total_additions += file.additions
-                total_deletions += file.deletions
+            data = self._graphql(self.PR_DETAILS_QUERY, {
+                "owner": self.owner,
+                "name": self.repo_name,
+                "number": pr_number
+            })
+            pr = data['repository']['pullRequest']
+            if pr is None:
+                raise ValueError(f"PR #{pr_number} not found in {self.config.github_repository}")
 
+            file_changes = [
+                {
+                    'filename': file['path'],
+                    'additions': file['additions'],
+                    'deletions': file['deletions'],
+                    'changes': file['additions'] + file['deletions'],
+                    'status': self.FILE_STATUSES.get(file['changeType'], file['changeType'].lower())
+                }
+                for file in pr['files']['nodes']
+            ]
+
+            if include_patches:
+                # Patches are extra review context; carry on without them if they can't be fetched
+                try:
+                    patches = self.get_patches(pr_number)
+                except Exception as e:
+                    logger.warning(f"Could not fetch patches for PR #{pr_number}, reviewing without them: {e}")
+                else:
+                    for file in file_changes:
+                        file['patch'] = patches.get(file['filename'])
+
+            # Totals come from the PR itself so they stay accurate past the first 100 files
             return {
-                'title': pr.title,
-                'body': pr.body or '',
-                'author': pr.user.login,
+                'title': pr['title'],
+                'body': pr['body'] or '',
+                'author': pr['author']['login'] if pr['author'] else 'ghost',
                 'files': file_changes,
-                'total_additions': total_additions,
-                'total_deletions': total_deletions,
-                'file_count': len(file_changes),
-                'url': pr.html_url,
-                'number': pr.number
+                'total_additions': pr['additions'],
+                'total_deletions': pr['deletions'],
+                'file_count': pr['changedFiles'],
+                'url': pr['url'],
+                'number': pr['number']
             }
 
         except Exception as e:
@@ -242,18 +698,26 @@ class GitHubService:
             True if successful, False otherwise
         """
         try:
-            pr = self.repo.get_pull(pr_number)
+            response = self._request(
+                "PUT",
+                f"{self.API_URL}/repos/{self.config.github_repository}/pulls/{pr_number}/merge",
+                json={
+                    "commit_message": f"Merged PR #{pr_number} via DevOps Flow Bot",
+                    "merge_method": "merge"
+                }
+            )
 
-            if pr.mergeable:
-                pr.merge(
-                    commit_message=f"Merged PR #{pr_number} via DevOps Flow Bot",
-                    merge_method="merge"
-                )
+            if response.status_code == 200:
                 logger.info(f"Successfully merged PR #{pr_number}")
                 return True
-            else:
-                logger.warning(f"PR #{pr_number} is not mergeable")
-                return False
+
+            # GitHub answers 405 when the PR is not mergeable and 409 when its head moved
+            try:
+                reason = response.json().get('message', response.text)
+            except ValueError:
+                reason = response.text
+            logger.warning(f"PR #{pr_number} is not mergeable ({response.status_code}): {reason}")
+            return False
 
         except Exception as e:
             logger.error(f"Error merging PR #{pr_number}: {e}")
@@ -271,8 +735,12 @@ class GitHubService:
             True if successful, False otherwise
         """
         try:
-            pr = self.repo.get_pull(pr_number)
-            pr.create_issue_comment(comment)
+            response = self._request(
+                "POST",
+                f"{self.API_URL}/repos/{self.config.github_repository}/issues/{pr_number}/comments",
+                json={"body": comment}
+            )
+            response.raise_for_status()
             logger.info(f"Posted comment on PR #{pr_number}")
             return True
 
@@ -284,9 +752,192 @@ class GitHubService:
 class SlackService:
     """Handle all Slack operations."""
 
-    def __init__(self, config: Config):
+    # Buttons in batched messages use this block ID prefix plus the PR number
+    BATCH_ACTIONS_PREFIX = "pr_review_actions_"
+    # Slack allows 50 blocks per message; each PR takes 5
+    MAX_BATCH_SIZE = 9
+
+    def __init__(self, config: Config, actions: TTLStore):
         self.client = SlackClient(token=config.slack_token)
         self.default_channel = config.default_slack_channel
+        # Server-side storage for button payloads
+        self.actions = actions
+        # Interaction responses go to hooks.slack.com, outside the Web API client
+        self.session = pooled_session()
+
+        # PR review requests waiting for their channel's batch window to close
+        self.batch_window = config.slack_batch_window
+        self._pending_reviews: Dict[str, List[Dict[str, Any]]] = {}
+        self._batch_timers: Dict[str, threading.Timer] = {}
+        self._batch_lock = threading.Lock()
+
+    def _action_value(self, data: Dict[str, Any]) -> Optional[str]:
+        """
+        Encode a button payload as a short reference to server-side storage.
+
+        Without shared storage, the payload is inlined as JSON so buttons keep
+        working across restarts.
+
+        Args:
+            data: Payload echoed back when the button is clicked
+
+        Returns:
+            Value for the button's "value" field, or None if shared storage is
+            unreachable (an inline fallback would be rejected by load_action_value)
+        """
+        value = orjson.dumps(data).decode()
+        if not self.actions.shared:
+            return value
+
+        token = secrets.token_urlsafe(12)
+        if not self.actions.set(token, value):
+            return None
+        return token
+
+    def load_action_value(self, value: str) -> Optional[Dict[str, Any]]:
+        """
+        Decode a button value created by _action_value.
+
+        Args:
+            value: The clicked button's "value" field
+
+        Returns:
+            Button payload, or None if its stored reference has expired or
+            it is inline JSON while shared storage is configured
+        """
+        if value.startswith('{'):
+            # Only references are issued with shared storage; an inline payload
+            # there is forged or tampered with, and would pick an arbitrary PR
+            if self.actions.shared:
+                logger.warning("Rejected inline Slack button value while button storage is shared")
+                return None
+            return orjson.loads(value)
+
+        stored = self.actions.get(value)
+        return orjson.loads(stored) if stored is not None else None
+
+    def pr_review_blocks(
+        self,
+        pr_details: Dict[str, Any],
+        ai_summary: str,
+        task_id: str,
+        notion_page_id: str,
+        actions_block_id: str = "pr_review_actions"
+    ) -> List[Dict[str, Any]]:
+        """
+        Build the Block Kit blocks describing one PR, with approval buttons.
+
+        Args:
+            pr_details: PR details dictionary
+            ai_summary: AI-generated review summary
+            task_id: Notion task ID
+            notion_page_id: Notion page ID
+            actions_block_id: Block ID of the buttons block, unique per message
+
+        Returns:
+            List of Block Kit blocks
+        """
+        blocks = [
+            {
+                "type": "header",
+                "text": {
+                    "type": "plain_text",
+                    "text": f"🔔 PR Review Request: {pr_details['title']}"
+                }
+            },
+            {
+                "type": "section",
+                "fields": [
+                    {
+                        "type": "mrkdwn",
+                        "text": f"*Author:*\n{pr_details['author']}"
+                    },
+                    {
+                        "type": "mrkdwn",
+                        "text": f"*Task ID:*\n{task_id}"
+                    },
+                    {
+                        "type": "mrkdwn",
+                        "text": f"*Files Changed:*\n{pr_details['file_count']}"
+                    },
+                    {
+                        "type": "mrkdwn",
+                        "text": f"*Changes:*\n+{pr_details['total_additions']} -{pr_details['total_deletions']}"
+                    }
+                ]
+            },
+            {
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": f"*AI Review Summary:*\n{ai_summary}"
+                }
+            }
+        ]
+
+        approve_value = self._action_value({
+            "pr_number": pr_details['number'],
+            "task_id": task_id,
+            "notion_page_id": notion_page_id,
+            "repo": pr_details.get('repo')
+        })
+        request_changes_value = self._action_value({
+            "pr_number": pr_details['number'],
+            "pr_url": pr_details['url']
+        })
+
+        view_button = {
+            "type": "button",
+            "text": {
+                "type": "plain_text",
+                "text": "🔗 View PR"
+            },
+            "url": pr_details['url'],
+            "action_id": "view_pr"
+        }
+
+        if approve_value is None or request_changes_value is None:
+            # Still notify reviewers when button storage is down; they can act on
+            # GitHub. One block in place of the buttons keeps batches within Slack's limit
+            blocks.append({
+                "type": "section",
+                "block_id": actions_block_id,
+                "text": {
+                    "type": "mrkdwn",
+                    "text": "⚠️ Approval buttons are unavailable for this PR. Please review and merge it on GitHub."
+                },
+                "accessory": view_button
+            })
+            return blocks
+
+        blocks.append({
+            "type": "actions",
+            "block_id": actions_block_id,
+            "elements": [
+                {
+                    "type": "button",
+                    "text": {
+                        "type": "plain_text",
+                        "text": "✅ Approve & Merge"
+                    },
+                    "style": "primary",
+                    "action_id": "approve_pr",
+                    "value": approve_value
+                },
+                {
+                    "type": "button",
+                    "text": {
+                        "type": "plain_text",
+                        "text": "❌ Request Changes"
+                    },
+                    "style": "danger",
+                    "action_id": "request_changes",
+                    "value": request_changes_value
+                },
+                view_button
+            ]
+        })
+        return blocks
 
     def send_pr_review_request(
         self,
@@ -311,100 +962,114 @@ class SlackService:
         """
         try:
             # Build Block Kit message with interactive buttons
+            blocks = self.pr_review_blocks(pr_details, ai_summary, task_id, notion_page_id)
+
+            response = self.client.chat_postMessage(
+                channel=channel,
+                text=f"PR Review Request: {pr_details['title']}",
+                blocks=blocks
+            )
+
+            logger.info(f"Sent PR review request to {channel}")
+            return response['ts']
+
+        except Exception as e:
+            logger.error(f"Error sending Slack message: {e}")
+            return None
+
+    def send_pr_review_batch(self, channel: str, reviews: List[Dict[str, Any]]) -> Optional[str]:
+        """
+        Send several PR review requests as a single Slack message.
+
+        Args:
+            channel: Slack channel name
+            reviews: Keyword arguments of send_pr_review_request, one per PR
+
+        Returns:
+            Message timestamp if successful, None otherwise
+        """
+        try:
+            pr_labels = ", ".join(f"#{review['pr_details']['number']}" for review in reviews)
             blocks = [
                 {
                     "type": "header",
                     "text": {
                         "type": "plain_text",
-                        "text": f"🔔 PR Review Request: {pr_details['title']}"
-                    }
-                },
-                {
-                    "type": "section",
-                    "fields": [
-                        {
-                            "type": "mrkdwn",
-                            "text": f"*Author:*\n{pr_details['author']}"
-                        },
-                        {
-                            "type": "mrkdwn",
-                            "text": f"*Task ID:*\n{task_id}"
-                        },
-                        {
-                            "type": "mrkdwn",
-                            "text": f"*Files Changed:*\n{pr_details['file_count']}"
-                        },
-                        {
-                            "type": "mrkdwn",
-                            "text": f"*Changes:*\n+{pr_details['total_additions']} -{pr_details['total_deletions']}"
-                        }
-                    ]
-                },
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"*AI Review Summary:*\n{ai_summary}"
+                        "text": f"🔔 {len(reviews)} PRs opened: {pr_labels}"
                     }
-                },
-                {
-                    "type": "actions",
-                    "block_id": "pr_review_actions",
-                    "elements": [
-                        {
-                            "type": "button",
-                            "text": {
-                                "type": "plain_text",
-                                "text": "✅ Approve & Merge"
-                            },
-                            "style": "primary",
-                            "action_id": "approve_pr",
-                            "value": json.dumps({
-                                "pr_number": pr_details['number'],
-                                "task_id": task_id,
-                                "notion_page_id": notion_page_id,
-                                "repo": pr_details.get('repo')
-                            })
-                        },
-                        {
-                            "type": "button",
-                            "text": {
-                                "type": "plain_text",
-                                "text": "❌ Request Changes"
-                            },
-                            "style": "danger",
-                            "action_id": "request_changes",
-                            "value": json.dumps({
-                                "pr_number": pr_details['number'],
-                                "pr_url": pr_details['url']
-                            })
-                        },
-                        {
-                            "type": "button",
-                            "text": {
-                                "type": "plain_text",
-                                "text": "🔗 View PR"
-                            },
-                            "url": pr_details['url'],
-                            "action_id": "view_pr"
-                        }
-                    ]
                 }
             ]
+            for review in reviews:
+                blocks.append({"type": "divider"})
+                blocks.extend(self.pr_review_blocks(
+                    actions_block_id=f"{self.BATCH_ACTIONS_PREFIX}{review['pr_details']['number']}",
+                    **review
+                ))
 
             response = self.client.chat_postMessage(
                 channel=channel,
-                text=f"PR Review Request: {pr_details['title']}",
+                text=f"PR Review Requests: {pr_labels}",
                 blocks=blocks
             )
 
-            logger.info(f"Sent PR review request to {channel}")
+            logger.info(f"Sent {len(reviews)} batched PR review requests to {channel}")
             return response['ts']
 
         except Exception as e:
-            logger.error(f"Error sending Slack message: {e}")
+            logger.error(f"Error sending batched Slack message: {e}")
             return None
 
+    def queue_pr_review_request(
+        self,
+        channel: str,
+        pr_details: Dict[str, Any],
+        ai_summary: str,
+        task_id: str,
+        notion_page_id: str
+    ) -> None:
+        """
+        Queue a PR review request, batching requests that arrive within the batch window.
+
+        Args:
+            channel: Slack channel name
+            pr_details: PR details dictionary
+            ai_summary: AI-generated review summary
+            task_id: Notion task ID
+            notion_page_id: Notion page ID
+        """
+        review = {
+            "pr_details": pr_details,
+            "ai_summary": ai_summary,
+            "task_id": task_id,
+            "notion_page_id": notion_page_id
+        }
+
+        if self.batch_window <= 0:
+            self.send_pr_review_request(channel=channel, **review)
+            return
+
+        with self._batch_lock:
+            self._pending_reviews.setdefault(channel, []).append(review)
+            if channel not in self._batch_timers:
+                # Non-daemon, so pending requests are still sent on shutdown
+                timer = threading.Timer(self.batch_window, self._flush_reviews, args=(channel,))
+                self._batch_timers[channel] = timer
+                timer.start()
+
+    def _flush_reviews(self, channel: str) -> None:
+        """Send the PR review requests queued for a channel."""
+        with self._batch_lock:
+            reviews = self._pending_reviews.pop(channel, [])
+            self._batch_timers.pop(channel, None)
+
+        for start in range(0, len(reviews), self.MAX_BATCH_SIZE):
+            chunk = reviews[start:start + self.MAX_BATCH_SIZE]
+            # A lone PR, including one left over after a split, gets the regular message
+            if len(chunk) == 1:
+                self.send_pr_review_request(channel=channel, **chunk[0])
+            else:
+                self.send_pr_review_batch(channel, chunk)
+
     def update_message(self, channel: str, ts: str, text: str) -> bool:
         """
         Update a Slack message.
@@ -428,17 +1093,118 @@ class SlackService:
             logger.error(f"Error updating Slack message: {e}")
             return False
 
+    def respond(self, response_url: str, message: Dict[str, Any]) -> bool:
+        """
+        Send a delayed response to a Slack interaction via its response URL.
+
+        Args:
+            response_url: The interaction's response_url
+            message: Message payload (text, blocks, replace_original, ...)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            response = self.session.post(response_url, json=message, timeout=10)
+            response.raise_for_status()
+            return True
+        except Exception as e:
+            logger.error(f"Error responding to Slack interaction: {e}")
+            return False
+
 
 class AIReviewService:
     """Handle AI-powered code reviews using LangChain."""
 
-    def __init__(self, config: Config):
-        self.llm = ChatOpenAI(
-            model="gpt-4o",
-            temperature=0,
-            api_key=config.openai_api_key
+    DEFAULT_MODEL = "gpt-4o"
+    # Cheaper, faster model for PRs touching fewer than SMALL_PR_FILES files
+    SMALL_PR_MODEL = "gpt-4o-mini"
+    SMALL_PR_FILES = 5
+
+    # Changes at or below this many lines in a single file skip the LLM
+    TRIVIAL_CHANGE_LINES = 5
+    # Plain .txt only counts under docs/, so requirements.txt or CMakeLists.txt still get a review
+    DOC_SUFFIXES = ('.md', '.rst')
+    DOC_NAMES = ('LICENSE', 'CHANGELOG', 'AUTHORS')
+    DOC_DIRS = ('docs/',)
+    # Dependency and build files, which always get a review
+    BUILD_FILE_PATTERN = re.compile(r'^(requirements.*|constraints.*)\.txt$|^CMakeLists\.txt$', re.IGNORECASE)
+
+    # Prompt bounds, so large PRs don't inflate token cost
+    MAX_PROMPT_FILES = 10
+    MAX_PATCH_LINES = 40
+    MAX_FILE_LIST_CHARS = 8000
+
+    def __init__(self, config: Config, cache: TTLStore):
+        self.api_key = config.openai_api_key
+        self.cache = cache
+        self._llms: Dict[str, ChatOpenAI] = {}
+        self._llm_lock = threading.Lock()
+
+    def _llm_for(self, model: str) -> ChatOpenAI:
+        """Return the shared chat model client for a model name."""
+        with self._llm_lock:
+            if model not in self._llms:
+                self._llms[model] = ChatOpenAI(
+                    model=model,
+                    temperature=0,
+                    api_key=self.api_key
+                )
+            return self._llms[model]
+
+    def _quick_summary(self, pr_details: Dict[str, Any]) -> Optional[str]:
+        """
+        Summarize PRs too small to be worth an LLM call.
+
+        Args:
+            pr_details: PR details dictionary
+
+        Returns:
+            Canned summary, or None if the PR needs a full review
+        """
+        files = pr_details['files']
+        # The file list may be truncated, so only trust it when it is complete
+        if not files or len(files) != pr_details['file_count']:
+            return None
+
+        changed_lines = pr_details['total_additions'] + pr_details['total_deletions']
+        if len(files) == 1 and changed_lines <= self.TRIVIAL_CHANGE_LINES:
+            return (
+                f"Trivial change to `{files[0]['filename']}` "
+                f"(+{pr_details['total_additions']} -{pr_details['total_deletions']}). Low complexity."
+            )
+
+        if all(self._is_doc(f['filename']) for f in files):
+            return "Documentation-only change. Low complexity."
+
+        return None
+
+    @classmethod
+    def _is_doc(cls, filename: str) -> bool:
+        """Whether a file is documentation that needs no code review."""
+        name = filename.rsplit('/', 1)[-1]
+        if cls.BUILD_FILE_PATTERN.match(name):
+            return False
+        return (
+            name.endswith(cls.DOC_SUFFIXES)
+            or name.split('.', 1)[0].upper() in cls.DOC_NAMES
+            or filename.startswith(cls.DOC_DIRS)
         )
 
+    @staticmethod
+    def _content_hash(pr_details: Dict[str, Any]) -> str:
+        """Hash the PR content the review depends on, ignoring PR number and URL."""
+        content = {
+            "title": pr_details['title'],
+            "body": pr_details['body'],
+            "files": [
+                (f['filename'], f['additions'], f['deletions'], f.get('patch'))
+                for f in pr_details['files']
+            ],
+            "totals": (pr_details['file_count'], pr_details['total_additions'], pr_details['total_deletions'])
+        }
+        return hashlib.sha256(orjson.dumps(content, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
     def generate_review(self, pr_details: Dict[str, Any]) -> str:
         """
         Generate AI review summary for a PR.
@@ -450,14 +1216,36 @@ class AIReviewService:
             AI-generated review summary
         """
         try:
-            # Build comprehensive prompt for AI review
-            file_list = "\n".join([
-                f"- `{f['filename']}`: {f['status']} (+{f['additions']}/-{f['deletions']})"
-                for f in pr_details['files'][:10]  # Limit to first 10 files
-            ])
+            quick_summary = self._quick_summary(pr_details)
+            if quick_summary is not None:
+                logger.info(f"Skipped AI review for small PR #{pr_details['number']}")
+                return quick_summary
+
+            # Redeliveries and rebases fire again with identical content
+            cache_key = self._content_hash(pr_details)
+            cached_summary = self.cache.get(cache_key)
+            if cached_summary is not None:
+                logger.info(f"Using cached AI review for PR #{pr_details['number']}")
+                return cached_summary
 
-            if pr_details['file_count'] > 10:
-                file_list += f"\n... and {pr_details['file_count'] - 10} more files"
+            # Build comprehensive prompt for AI review
+            file_entries = []
+            file_list_chars = 0
+            for f in pr_details['files'][:self.MAX_PROMPT_FILES]:
+                entry = f"- `{f['filename']}`: {f['status']} (+{f['additions']}/-{f['deletions']})"
+                if f.get('patch'):
+                    patch = "\n".join(f['patch'].splitlines()[:self.MAX_PATCH_LINES])
+                    entry += f"\n```diff\n{patch}\n```"
+
+                if file_list_chars + len(entry) > self.MAX_FILE_LIST_CHARS:
+                    break
+                file_entries.append(entry)
+                file_list_chars += len(entry)
+
+            file_list = "\n".join(file_entries)
+            omitted_files = pr_details['file_count'] - len(file_entries)
+            if omitted_files > 0:
+                file_list += f"\n... and {omitted_files} more files"
 
             prompt = f"""Review this pull request and provide a concise summary:
 
@@ -477,8 +1265,10 @@ Please provide:
 
 Keep the response concise and actionable."""
 
-            response = self.llm.invoke(prompt)
+            model = self.SMALL_PR_MODEL if pr_details['file_count'] < self.SMALL_PR_FILES else self.DEFAULT_MODEL
+            response = self._llm_for(model).invoke(prompt)
             summary = response.content
+            self.cache.set(cache_key, summary)
 
             logger.info(f"Generated AI review for PR #{pr_details['number']}")
             return summary
@@ -491,12 +1281,78 @@ Keep the response concise and actionable."""
 class DevOpsBot:
     """Main bot orchestrator."""
 
+    # Labelled task IDs take precedence, tried in this order
+    TASK_ID_LABELLED = (
+        re.compile(r'Notion Task:\s*([A-Z]+-\d+)', re.IGNORECASE),
+        re.compile(r'Task:\s*([A-Z]+-\d+)', re.IGNORECASE),
+        re.compile(r'Task ID:\s*([A-Z]+-\d+)', re.IGNORECASE),
+    )
+    # More flexible pattern - matches any TASK-## format anywhere in text
+    TASK_ID_ANYWHERE = re.compile(r'\b([A-Z]+-\d+)\b', re.IGNORECASE)
+
+    # Seconds to wait on Redis before treating it as unavailable
+    REDIS_TIMEOUT = 0.5
+
     def __init__(self, config: Config):
         self.config = config
-        self.notion = NotionService(config)
-        self.github = GitHubService(config)
-        self.slack = SlackService(config)
-        self.ai_review = AIReviewService(config)
+        # Fan-out pool for independent API calls within a single event
+        self.io_pool = ThreadPoolExecutor(
+            max_workers=config.background_workers * 2,
+            thread_name_prefix="devops-io"
+        )
+
+    # Services are created on first use, so /health and ignored events don't pay for them
+    # (under a lock, since the first reads race across request and pool threads)
+
+    @locked_cached_property
+    def notion(self) -> NotionService:
+        """Notion service."""
+        return NotionService(self.config)
+
+    @locked_cached_property
+    def github(self) -> GitHubService:
+        """GitHub service."""
+        return GitHubService(self.config)
+
+    @locked_cached_property
+    def slack(self) -> SlackService:
+        """Slack service, keeping button payloads in Redis when available."""
+        # Review requests can wait for days before someone clicks a button
+        return SlackService(
+            self.config,
+            actions=TTLStore(self.redis, "slack:action:", ttl=7 * 24 * 3600)
+        )
+
+    @locked_cached_property
+    def redis(self) -> Optional[redis.Redis]:
+        """Optional shared state for caches, so they survive restarts and span workers."""
+        if not self.config.redis_url:
+            return None
+        # Short timeouts so an unreachable Redis fails open instead of hanging requests
+        return redis.Redis.from_url(
+            self.config.redis_url,
+            decode_responses=True,
+            socket_timeout=self.REDIS_TIMEOUT,
+            socket_connect_timeout=self.REDIS_TIMEOUT
+        )
+
+    @locked_cached_property
+    def deliveries(self) -> TTLStore:
+        """GitHub webhook delivery IDs already accepted."""
+        return TTLStore(self.redis, "gh:delivery:", ttl=3600, maxsize=4096)
+
+    @locked_cached_property
+    def interactions(self) -> TTLStore:
+        """Slack interaction trigger IDs already handled."""
+        return TTLStore(self.redis, "slack:trigger:", ttl=3600, maxsize=4096)
+
+    @locked_cached_property
+    def ai_review(self) -> AIReviewService:
+        """AI review service, caching reviews in Redis when available."""
+        return AIReviewService(
+            self.config,
+            cache=TTLStore(self.redis, "ai_review:", ttl=24 * 3600, maxsize=256)
+        )
 
     def extract_task_id(self, pr_body: str) -> Optional[str]:
         """
@@ -508,26 +1364,36 @@ class DevOpsBot:
         Returns:
             Task ID if found, None otherwise
         """
+        return self._match_task_id(pr_body)[0]
+
+    def _match_task_id(self, pr_body: str) -> Tuple[Optional[str], bool]:
+        """
+        Extract task ID from PR body, noting whether it was labelled.
+
+        Args:
+            pr_body: PR description text
+
+        Returns:
+            Task ID (or None) and whether it followed a "Task:"-style label
+        """
         if not pr_body:
-            return None
+            return None, False
 
         # Match patterns with specific prefixes first (more precise)
-        patterns = [
-            r'Notion Task:\s*([A-Z]+-\d+)',
-            r'Task:\s*([A-Z]+-\d+)',
-            r'Task ID:\s*([A-Z]+-\d+)',
-            # More flexible pattern - matches any TASK-## format anywhere in text
-            r'\b([A-Z]+-\d+)\b'
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, pr_body, re.IGNORECASE)
+        for pattern in self.TASK_ID_LABELLED:
+            match = pattern.search(pr_body)
             if match:
-                task_id = match.group(1).upper()
-                logger.info(f"Extracted task ID: {task_id}")
-                return task_id
-
-        return None
+                labelled = True
+                break
+        else:
+            match = self.TASK_ID_ANYWHERE.search(pr_body)
+            labelled = False
+            if not match:
+                return None, False
+
+        task_id = match.group(1).upper()
+        logger.info(f"Extracted task ID: {task_id}")
+        return task_id, labelled
 
     def handle_pr_opened(self, pr_data: Dict[str, Any], repo_name: str) -> Dict[str, str]:
         """
@@ -546,7 +1412,7 @@ class DevOpsBot:
             pr_body = pr_data.get('body', '')
 
             # Extract task ID from PR body
-            task_id = self.extract_task_id(pr_body)
+            task_id, labelled = self._match_task_id(pr_body)
             if not task_id:
                 logger.warning(f"No task ID found in PR #{pr_number}")
                 return {
@@ -554,9 +1420,20 @@ class DevOpsBot:
                     "message": "No Notion task ID found in PR description"
                 }
 
+            # PR details don't depend on Notion, so fetch them while the task is
+            # resolved, but only when the ID was labelled: the fallback pattern
+            # also matches strings like UTF-8 that are rarely real tasks
+            pr_details_future = None
+            if labelled:
+                pr_details_future = self.io_pool.submit(
+                    self.github.get_pr_details, pr_number, self.config.ai_review_patches
+                )
+
             # Find Notion page by task ID
             notion_page_id = self.notion.find_task_by_id(task_id)
             if not notion_page_id:
+                if pr_details_future is not None:
+                    pr_details_future.cancel()
                 logger.warning(f"Notion page not found for task {task_id}")
                 return {
                     "status": "error",
@@ -564,24 +1441,30 @@ class DevOpsBot:
                 }
 
             # Update Notion task to "Verify" status
-            self.notion.update_task(notion_page_id, "Verify", pr_url)
+            notion_update = self.io_pool.submit(
+                self.notion.update_task, notion_page_id, "Verify", pr_url
+            )
 
             # Get PR details
-            pr_details = self.github.get_pr_details(pr_number)
+            if pr_details_future is not None:
+                pr_details = pr_details_future.result()
+            else:
+                pr_details = self.github.get_pr_details(pr_number, self.config.ai_review_patches)
             pr_details['repo'] = repo_name
 
             # Generate AI review
             ai_summary = self.ai_review.generate_review(pr_details)
 
-            # Post AI review as GitHub comment
-            self.github.post_comment(
+            # Post AI review as GitHub comment alongside the Slack notification
+            comment = self.io_pool.submit(
+                self.github.post_comment,
                 pr_number,
                 f"## 🤖 AI Code Review\n\n{ai_summary}\n\n---\n*Generated by DevOps Flow Bot*"
             )
 
             # Send Slack notification with approval buttons
             slack_channel = self.slack.default_channel
-            self.slack.send_pr_review_request(
+            self.slack.queue_pr_review_request(
                 channel=slack_channel,
                 pr_details=pr_details,
                 ai_summary=ai_summary,
@@ -589,6 +1472,9 @@ class DevOpsBot:
                 notion_page_id=notion_page_id
             )
 
+            comment.result()
+            notion_update.result()
+
             logger.info(f"Successfully processed PR #{pr_number} for task {task_id}")
             return {
                 "status": "success",
@@ -620,7 +1506,8 @@ class DevOpsBot:
 
             if merge_success:
                 # Update Notion task to "Done"
-                self.notion.update_task(notion_page_id, "Done")
+                if self.notion.update_task(notion_page_id, "Done"):
+                    self.notion.invalidate_task(task_id)
 
                 logger.info(f"PR #{pr_number} approved and merged, task {task_id} marked as Done")
                 return {
@@ -646,22 +1533,181 @@ try:
     config = Config()
     config.validate()
     bot = DevOpsBot(config)
+    # Webhook work runs here so GitHub and Slack get their response immediately
+    executor = ThreadPoolExecutor(
+        max_workers=config.background_workers,
+        thread_name_prefix="devops-bot"
+    )
     logger.info("DevOps Bot initialized successfully")
 except Exception as e:
     logger.error(f"Failed to initialize bot: {e}")
     bot = None
 
 
+def run_in_background(func, *args) -> None:
+    """Queue func(*args) on the background executor, logging its outcome."""
+    def _run():
+        try:
+            result = func(*args)
+            logger.info(f"Background task {func.__name__} finished: {result}")
+        except Exception as e:
+            logger.error(f"Background task {func.__name__} failed: {e}", exc_info=True)
+
+    executor.submit(_run)
+
+
+def process_pr_opened(pr_data: Dict[str, Any], repo_name: str, delivery_id: Optional[str]) -> Dict[str, str]:
+    """
+    Handle a PR opened delivery, releasing its delivery ID if processing fails.
+
+    The webhook is acknowledged before processing, so GitHub never retries it;
+    a manual redelivery (same delivery ID) is the only way to recover.
+
+    Args:
+        pr_data: PR data from webhook
+        repo_name: Repository full name
+        delivery_id: X-GitHub-Delivery header, if present
+
+    Returns:
+        Result dictionary with status and message
+    """
+    try:
+        result = bot.handle_pr_opened(pr_data, repo_name)
+    except Exception:
+        if delivery_id:
+            bot.deliveries.discard(delivery_id)
+        raise
+
+    if result['status'] == 'error' and delivery_id:
+        bot.deliveries.discard(delivery_id)
+    return result
+
+
 def verify_webhook_signature(request_data: bytes, signature: str) -> bool:
     """Verify GitHub webhook signature."""
-    if not signature:
+    if not signature or not signature.startswith('sha256='):
+        return False
+
+    try:
+        signature_bytes = bytes.fromhex(signature[len('sha256='):])
+    except ValueError:
         return False
 
-    secret = config.webhook_secret.encode()
-    hash_val = hmac.new(secret, request_data, hashlib.sha256).hexdigest()
-    expected_signature = f'sha256={hash_val}'
+    expected = hmac.new(config.webhook_secret_bytes, request_data, hashlib.sha256).digest()
+    return hmac.compare_digest(expected, signature_bytes)
+
+
+# Merged notes of batched Slack messages, keyed by "channel:ts". Approvals of
+# PRs in the same batch finish out of order, so each update is rebuilt from
+# every merge so far rather than from the (stale) blocks its click carried.
+batch_merges = TTLCache(maxsize=1024, ttl=7 * 24 * 3600)
+batch_merges_lock = threading.Lock()
+
+
+def complete_pr_approval(
+    pr_number: int,
+    task_id: str,
+    notion_page_id: str,
+    user: str,
+    response_url: str,
+    block_id: str,
+    batch_blocks: Optional[List[Dict[str, Any]]] = None,
+    batch_key: Optional[str] = None
+) -> Dict[str, str]:
+    """
+    Merge an approved PR and report the outcome back to Slack.
+
+    Args:
+        pr_number: PR number
+        task_id: Task ID
+        notion_page_id: Notion page ID
+        user: Slack username of the approver
+        response_url: Slack response URL of the originating interaction
+        block_id: Block ID of the clicked buttons
+        batch_blocks: Blocks of the original message, if it listed several PRs
+        batch_key: "channel:ts" of the original message, if it listed several PRs
+
+    Returns:
+        Result dictionary with status and message
+    """
+    result = bot.handle_pr_approval(pr_number, task_id, notion_page_id)
+
+    if result['status'] != 'success':
+        bot.slack.respond(response_url, {
+            "replace_original": False,
+            "text": f"❌ *Merge Failed*\n\n{result['message']}\n\nPlease check the PR status and try again manually."
+        })
+        return result
 
-    return hmac.compare_digest(expected_signature, signature)
+    pr_url = f"https://github.com/{config.github_repository}/pull/{pr_number}"
+
+    # Send confirmation message back to Slack channel
+    try:
+        bot.slack.client.chat_postMessage(
+            channel=bot.slack.default_channel,
+            text=f"✅ PR #{pr_number} merged successfully!",
+            blocks=[
+                {
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": f"✅ *PR Merged Successfully!*\n\n*PR:* <{pr_url}|#{pr_number}>\n*Task:* {task_id}\n*Approved by:* @{user}\n*Status:* Notion task marked as `Done`"
+                    }
+                }
+            ]
+        )
+    except Exception as slack_error:
+        logger.error(f"Failed to send Slack confirmation: {slack_error}")
+
+    # In a batched message only this PR's buttons are replaced
+    if batch_blocks:
+        merged_note = {
+            "type": "context",
+            "block_id": block_id,
+            "elements": [
+                {
+                    "type": "mrkdwn",
+                    "text": f"✅ PR #{pr_number} was approved and merged by @{user}. Task {task_id} marked as Done"
+                }
+            ]
+        }
+        with batch_merges_lock:
+            message_lock, merged_notes = batch_merges.setdefault(batch_key, (threading.Lock(), {}))
+
+        # Held while responding so a later update never lands before an earlier one
+        with message_lock:
+            merged_notes[block_id] = merged_note
+            bot.slack.respond(response_url, {
+                "replace_original": True,
+                "text": f"✅ PR #{pr_number} was merged by @{user}",
+                "blocks": [merged_notes.get(block.get('block_id'), block) for block in batch_blocks]
+            })
+        return result
+
+    # Update the original message to show it's been processed
+    bot.slack.respond(response_url, {
+        "replace_original": True,
+        "text": f"✅ PR #{pr_number} was merged by @{user}",
+        "blocks": [
+            {
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": f"✅ *PR Merged*\n\nPR #{pr_number} was approved and merged by @{user}\nTask {task_id} marked as Done"
+                }
+            },
+            {
+                "type": "context",
+                "elements": [
+                    {
+                        "type": "mrkdwn",
+                        "text": f"View PR: <{pr_url}|#{pr_number}>"
+                    }
+                ]
+            }
+        ]
+    })
+    return result
 
 
 @app.route('/health', methods=['GET'])
@@ -683,6 +1729,7 @@ def github_webhook():
     if bot is None:
         return jsonify({"error": "Bot not initialized"}), 503
 
+    delivery_id = None
     try:
         # Verify webhook signature
         signature = request.headers.get('X-Hub-Signature-256')
@@ -691,28 +1738,36 @@ def github_webhook():
             return jsonify({"error": "Invalid signature"}), 403
 
         event_type = request.headers.get('X-GitHub-Event')
-        data = request.json
-
         logger.info(f"Received GitHub webhook: {event_type}")
 
-        # Handle pull request events
-        if event_type == 'pull_request':
-            action = data.get('action')
+        # Only pull request events are handled; skip parsing anything else
+        if event_type != 'pull_request':
+            return jsonify({"status": "ignored", "event": event_type}), 200
 
-            if action == 'opened':
-                pr_data = data['pull_request']
-                repo_name = data['repository']['full_name']
+        # GitHub redelivers on timeouts and errors; process each delivery once
+        delivery_id = request.headers.get('X-GitHub-Delivery')
+        if delivery_id and not bot.deliveries.add(delivery_id, "1"):
+            logger.info(f"Ignoring duplicate GitHub delivery {delivery_id}")
+            return jsonify({"status": "duplicate"}), 200
 
-                result = bot.handle_pr_opened(pr_data, repo_name)
-                return jsonify(result), 200
-            else:
-                logger.info(f"Ignoring PR action: {action}")
-                return jsonify({"status": "ignored", "action": action}), 200
+        data = orjson.loads(request.data)
+        action = data.get('action')
+
+        if action != 'opened':
+            logger.info(f"Ignoring PR action: {action}")
+            return jsonify({"status": "ignored", "action": action}), 200
+
+        pr_data = data['pull_request']
+        repo_name = data['repository']['full_name']
 
-        return jsonify({"status": "processed", "event": event_type}), 200
+        run_in_background(process_pr_opened, pr_data, repo_name, delivery_id)
+        return jsonify({"status": "queued"}), 202
 
     except Exception as e:
         logger.error(f"Webhook error: {e}", exc_info=True)
+        # Release the claim so GitHub's redelivery of this event is processed
+        if delivery_id:
+            bot.deliveries.discard(delivery_id)
         return jsonify({"error": "Internal server error"}), 500
 
 
@@ -724,78 +1779,58 @@ def slack_interactions():
 
     try:
         # Parse Slack payload
-        payload = json.loads(request.form.get('payload'))
+        payload = orjson.loads(request.form['payload'])
         action = payload['actions'][0]
         action_id = action['action_id']
         user = payload['user']['username']
 
+        trigger_id = payload.get('trigger_id')
+        if trigger_id and not bot.interactions.add(trigger_id, "1"):
+            logger.info(f"Ignoring duplicate Slack interaction {trigger_id}")
+            return jsonify({"status": "duplicate"}), 200
+
         logger.info(f"Received Slack interaction: {action_id} from user {user}")
 
+        if action_id in ('approve_pr', 'request_changes'):
+            action_value = bot.slack.load_action_value(action['value'])
+            if action_value is None:
+                return jsonify({
+                    "replace_original": False,
+                    "text": "⌛ This review request has expired. Please review the PR on GitHub."
+                })
+
         if action_id == 'approve_pr':
-            # Parse action value
-            action_value = json.loads(action['value'])
             pr_number = action_value['pr_number']
             task_id = action_value['task_id']
             notion_page_id = action_value['notion_page_id']
 
-            # Handle PR approval
-            result = bot.handle_pr_approval(pr_number, task_id, notion_page_id)
-
-            # Respond to Slack with rich confirmation
-            if result['status'] == 'success':
-                # Get PR URL from GitHub
-                pr_url = f"https://github.com/{config.github_repository}/pull/{pr_number}"
+            batch_blocks = None
+            batch_key = None
+            if action.get('block_id', '').startswith(SlackService.BATCH_ACTIONS_PREFIX):
+                message = payload.get('message', {})
+                batch_blocks = message.get('blocks')
+                batch_key = f"{payload.get('channel', {}).get('id')}:{message.get('ts')}"
+
+            # Merging can take longer than Slack's 3 second timeout, so
+            # acknowledge now and report the outcome via the response URL
+            run_in_background(
+                complete_pr_approval,
+                pr_number,
+                task_id,
+                notion_page_id,
+                user,
+                payload['response_url'],
+                action.get('block_id'),
+                batch_blocks,
+                batch_key
+            )
 
-                # Send confirmation message back to Slack channel
-                try:
-                    bot.slack.client.chat_postMessage(
-                        channel=bot.slack.default_channel,
-                        text=f"✅ PR #{pr_number} merged successfully!",
-                        blocks=[
-                            {
-                                "type": "section",
-                                "text": {
-                                    "type": "mrkdwn",
-                                    "text": f"✅ *PR Merged Successfully!*\n\n*PR:* <{pr_url}|#{pr_number}>\n*Task:* {task_id}\n*Approved by:* @{user}\n*Status:* Notion task marked as `Done`"
-                                }
-                            }
-                        ]
-                    )
-                except Exception as slack_error:
-                    logger.error(f"Failed to send Slack confirmation: {slack_error}")
-
-                # Update the original message to show it's been processed
-                return jsonify({
-                    "replace_original": True,
-                    "text": f"✅ PR #{pr_number} was merged by @{user}",
-                    "blocks": [
-                        {
-                            "type": "section",
-                            "text": {
-                                "type": "mrkdwn",
-                                "text": f"✅ *PR Merged*\n\nPR #{pr_number} was approved and merged by @{user}\nTask {task_id} marked as Done"
-                            }
-                        },
-                        {
-                            "type": "context",
-                            "elements": [
-                                {
-                                    "type": "mrkdwn",
-                                    "text": f"View PR: <{pr_url}|#{pr_number}>"
-                                }
-                            ]
-                        }
-                    ]
-                })
-            else:
-                return jsonify({
-                    "replace_original": False,
-                    "text": f"❌ *Merge Failed*\n\n{result['message']}\n\nPlease check the PR status and try again manually."
-                })
+            return jsonify({
+                "replace_original": False,
+                "text": f"⏳ Merging PR #{pr_number}..."
+            })
 
         elif action_id == 'request_changes':
-            # Parse action value
-            action_value = json.loads(action['value'])
             pr_url = action_value['pr_url']
 
             return jsonify({
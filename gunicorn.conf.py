@@ -0,0 +1,25 @@
+"""
+Gunicorn configuration for DevOps Flow Bot.
+
+Run with: gunicorn bot:app
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5001')}"
+
+# Views are synchronous and webhook work is I/O on the bot's own thread pools,
+# so one threaded worker handles many deliveries without gevent patching.
+# The GitHub rate limiter, Slack batching and Notion lookup cache live in the
+# process, so extra workers multiply the GitHub budget and split batches;
+# scale with threads instead.
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "16"))
+
+keepalive = 5
+timeout = 30
+# Leave time for queued background work and Slack batches to finish on shutdown
+graceful_timeout = 30
+
+accesslog = "-"